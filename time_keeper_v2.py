@@ -18,7 +18,7 @@
 # Features:
 #   - Clock in/out with timestamps
 #   - Multi-user support with user switching and summary totals
-#   - Per-project JSON log files
+#   - Per-project append-only JSON Lines session logs
 #   - Daily / weekly / monthly time reports
 #   - Portable paths (default “data” folder next to script)
 #   - Automatic folder creation and safe file handling
@@ -45,14 +45,45 @@
 
 
 
+import atexit
+import bisect
+import contextlib
+import functools
 import json
+import mmap
+import os
+import signal
+import sys
+import time
+from array import array
+from collections import OrderedDict
+from collections.abc import Iterator
 from datetime import datetime, timedelta
 from pathlib import Path
+from types import FrameType
+
+# orjson is optional: it is much faster, but the standard library is enough
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 PROJECT_DEFAULT_NAME = "default_project"
 
 BASE_DIR = Path(__file__).parent  # folder where this script lives
 
+# Characters allowed in a project file name, and a table that deletes every
+# other ASCII character (non-ASCII characters are dropped separately)
+_SLUG_ALLOWED_CHARACTERS = "abcdefghijklmnopqrstuvwxyz0123456789_-"
+_SLUG_DELETE_TABLE = str.maketrans("", "", "".join(
+    chr(code) for code in range(128) if chr(code) not in _SLUG_ALLOWED_CHARACTERS
+))
+
+FILE_CACHE_SIZE = 8  # how many session logs are kept open for appending between saves
+
+SAVE_BATCH_SIZE = 10     # write to disk after this many save_data calls...
+SAVE_BATCH_SECONDS = 5   # ...or once this many seconds have passed since the last write
+
 
 
 #~*~*~*~*~*~*~*~*~*~*~*~*~*~*~*~*~*~*~*~*~*~#
@@ -63,26 +94,47 @@ BASE_DIR = Path(__file__).parent  # folder where this script lives
 
 
 
+@functools.lru_cache(maxsize=256)
 def slugify(project_name: str) -> str:
 
     """
     Convert a project name into a safe file name (lowercase, no spaces or symbols).
+    Results are cached, since the same project name is slugified over and over.
     """
     
     formatted_name = project_name.strip().lower().replace(" ", "_")
-    allowed_characters = "abcdefghijklmnopqrstuvwxyz0123456789_-"
-    
-    safe_name = "".join(char for char in formatted_name if char in allowed_characters)
+
+    # Drop non-ASCII characters, then every disallowed ASCII one, in two C-level passes
+    ascii_name = formatted_name.encode("ascii", "ignore").decode("ascii")
+    safe_name = ascii_name.translate(_SLUG_DELETE_TABLE)
     
     return safe_name or "silly_goose"
 
 
+# Folders already created (or found) during this run
+_ensured_dirs: set[Path] = set()
+
+
+def _ensure_dir(directory: Path) -> None:
+
+    """
+    Create a folder (and any parents) the first time it is needed.
+    Later calls for the same folder skip the mkdir system call.
+    """
+
+    if directory not in _ensured_dirs:
+        directory.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(directory)
+
+
+@functools.lru_cache(maxsize=32)
 def get_log_file(project_name: str, custom_folder_path: str | None) -> Path:
 
     """
-    Build and return the complete file path for this project's JSON log file.
+    Build and return the complete file path for this project's session log file.
     Uses the custom folder if provided, otherwise defaults to './data'.
-    -> JSON folder
+    Results are cached per (project name, folder).
+    -> JSON Lines folder
     """
 
     # Determine where the log file should be stored
@@ -95,10 +147,10 @@ def get_log_file(project_name: str, custom_folder_path: str | None) -> Path:
     project_slug = slugify(project_name or PROJECT_DEFAULT_NAME)
 
     # Make sure the directory exists
-    logs_directory.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(logs_directory)
 
-    # Build the full file path, e.g. /data/myproject_time_log.json
-    return logs_directory / f"{project_slug}_time_log.json"
+    # Build the full file path, e.g. /data/myproject_time_log.jsonl
+    return logs_directory / f"{project_slug}_time_log.jsonl"
 
 
 
@@ -110,61 +162,692 @@ def get_log_file(project_name: str, custom_folder_path: str | None) -> Path:
 
 
                                                                                             
-def save_data(data_dictionary: dict, log_file_path: Path) -> None:
+def _dumps(data_dictionary: dict) -> bytes:
+
+    """
+    Encode a dictionary as compact UTF-8 JSON bytes (no indentation or spaces).
+    Uses orjson when it is installed, otherwise the standard json module.
+    """
+
+    if orjson is not None:
+        return orjson.dumps(data_dictionary)
+
+    return json.dumps(data_dictionary, separators=(",", ":")).encode("utf-8")
+
+
+def _dumps_line(row: dict) -> bytes:
+
+    """
+    Encode a dictionary as one line of compact JSON, ending with a newline.
+    """
+
+    return _dumps(row) + b"\n"
+
+
+def _loads(raw_json: bytes | memoryview) -> dict:
+
+    """
+    Decode UTF-8 JSON bytes back into Python objects.
+    Uses orjson when it is installed, otherwise the standard json module.
+    orjson can parse a memoryview directly, without copying it first.
+    """
+
+    if orjson is not None:
+        return orjson.loads(raw_json)
+
+    return json.loads(bytes(raw_json))
+
+
+# session log path → descriptor open for appending, least recently used first
+_fd_cache: OrderedDict[Path, int] = OrderedDict()
+
+
+def _open_cached(file_path: Path) -> int:
+
+    """
+    Return a file descriptor for appending to a session log, creating the file if needed.
+    It is opened with O_APPEND, so every write lands at the current end of the file,
+    even when another instance is appending to the same log.
+    Descriptors stay open between calls so repeated saves skip open()/close().
+    The least recently used one is closed once more than FILE_CACHE_SIZE are open.
+    Only used for writing; reads open the file on their own and close it right away.
+    """
+
+    file_descriptor = _fd_cache.get(file_path)
+    if file_descriptor is not None:
+        _fd_cache.move_to_end(file_path)
+        return file_descriptor
+
+    file_descriptor = os.open(
+        file_path, os.O_RDWR | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o644
+    )
+    _fd_cache[file_path] = file_descriptor
+
+    if len(_fd_cache) > FILE_CACHE_SIZE:
+        _, evicted_descriptor = _fd_cache.popitem(last=False)
+        os.close(evicted_descriptor)
+
+    return file_descriptor
+
+
+def _flush_fd_cache() -> None:
+
+    """
+    Sync every cached file to disk and close it. Runs automatically at exit.
+    """
+
+    while _fd_cache:
+        _, file_descriptor = _fd_cache.popitem(last=False)
+        os.fsync(file_descriptor)
+        os.close(file_descriptor)
+
+
+atexit.register(_flush_fd_cache)
+
+
+def _write_all(file_descriptor: int, output_bytes: bytes) -> None:
+
+    """
+    Write a whole bytes buffer straight to a file descriptor with os.write,
+    skipping Python's buffered file layer. Loops only if the OS takes a partial write.
+    """
+
+    remaining = memoryview(output_bytes)
+    while remaining:
+        written = os.write(file_descriptor, remaining)
+        remaining = remaining[written:]
+
+
+def _replace_file(file_path: Path, output_bytes: bytes) -> None:
+
+    """
+    Atomically replace the file at file_path with output_bytes.
+    The bytes go to a temporary file next to it, which is synced and then
+    renamed over the original, so a crash never leaves a half-written file.
+    """
+
+    temporary_path = file_path.with_suffix(file_path.suffix + ".tmp")
+
+    file_descriptor = os.open(
+        temporary_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644
+    )
+    try:
+        _write_all(file_descriptor, output_bytes)
+        os.fsync(file_descriptor)
+    finally:
+        os.close(file_descriptor)
+
+    os.replace(temporary_path, file_path)
+
+
+def _loads_unterminated(line: bytes) -> dict | None:
+
+    """
+    Parse a last log line that has no newline after it.
+    Returns None if it was cut off mid-row (it is not valid JSON then).
+    """
+
+    try:
+        return _loads(line)
+    except ValueError:
+        return None
+
+
+def _repair_log_tail(file_descriptor: int) -> None:
+
+    """
+    Get a session log ready to be appended to after a crash during a write.
+
+    Every row is written with its newline in one go, so a log whose last
+    byte is not a newline has a cut-off last line, which is trimmed away.
+    If that line is a complete row that only lost its newline, the newline is
+    added back instead.
+    """
+
+    log_size = os.fstat(file_descriptor).st_size
+    if log_size == 0:
+        return
+
+    os.lseek(file_descriptor, log_size - 1, os.SEEK_SET)
+    if os.read(file_descriptor, 1) == b"\n":
+        return
+
+    with mmap.mmap(file_descriptor, 0, access=mmap.ACCESS_READ) as mapped_file:
+        complete_length = mapped_file.rfind(b"\n") + 1
+        last_row = _loads_unterminated(mapped_file[complete_length:])
+
+    if last_row is not None:
+        _write_all(file_descriptor, b"\n")
+    else:
+        os.ftruncate(file_descriptor, complete_length)
+
+
+@contextlib.contextmanager
+def _mapped_contents(file_path: Path) -> Iterator[bytes | mmap.mmap]:
+
+    """
+    Give read access to a whole file through a read-only memory map.
+    A missing or empty file gives back b"".
+    The file is opened read-only and closed again as soon as the caller is done,
+    so reading works on read-only files and never holds a handle between calls.
+    """
+
+    if not file_path.exists():
+        yield b""
+        return
+
+    with open(file_path, "rb") as file:
+        # An empty file cannot be memory-mapped
+        if os.fstat(file.fileno()).st_size == 0:
+            yield b""
+            return
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+            yield mapped_file
+
+
+def _read_json_file(json_file_path: Path) -> dict:
+
+    """
+    Read a whole JSON file from disk through a read-only memory map.
+    A missing or empty file gives back an empty dictionary.
+    """
 
+    with _mapped_contents(json_file_path) as file_contents:
+        if not file_contents:
+            return {}
+
+        # Parse straight from the mapped pages instead of reading a copy
+        with memoryview(file_contents) as contents_view:
+            return _loads(contents_view)
+
+
+def get_meta_file(log_file_path: Path) -> Path:
+
+    """
+    Return the path of the small meta file that sits next to a session log.
+    e.g. /data/myproject_time_log.jsonl -> /data/myproject_meta.json
+    """
+
+    project_slug = log_file_path.name.removesuffix(".jsonl").removesuffix("_time_log")
+
+    return log_file_path.with_name(f"{project_slug}_meta.json")
+
+
+def iter_sessions(log_file_path: Path) -> Iterator[dict]:
+
+    """
+    Lazily yield every session row stored in the JSON Lines log, oldest first.
+    Each row looks like {"user": ..., "start": ..., "end": ..., "dur_s": ...}.
+    Yields nothing if the log does not exist yet.
+
+    Every row is written with its newline in one go, so a last line without
+    one was cut off by a crash and is skipped, unless it is still a complete
+    row. The log itself is only repaired by the next write.
+    """
+
+    with _mapped_contents(log_file_path) as mapped_log:
+        for line in iter(mapped_log.readline, b"") if mapped_log else ():
+            if not line.endswith(b"\n"):
+                last_row = _loads_unterminated(line)
+                if last_row is not None:
+                    yield last_row
+                break
+
+            if line.strip():
+                yield _loads(line)
+
+
+def iter_sessions_reversed(log_file_path: Path) -> Iterator[dict]:
+
+    """
+    Lazily yield the session rows in the JSON Lines log, newest first.
+    A plain log is read backwards from the end one line at a time, so a caller
+    that stops early never reads or parses the older part of the file.
+    A cut-off last line is skipped, as in iter_sessions.
+    Yields nothing if the log does not exist yet.
     """
-    Save the data dictionary as formatted JSON inside the file at log_file_path.
+
+    with _mapped_contents(log_file_path) as log_buffer:
+        line_end = log_buffer.rfind(b"\n") + 1
+
+        last_row = _loads_unterminated(log_buffer[line_end:]) if line_end < len(log_buffer) else None
+        if last_row is not None:
+            yield last_row
+
+        # Walk backwards from the last complete line to the start of the file
+        while line_end > 0:
+            line_start = log_buffer.rfind(b"\n", 0, line_end - 1) + 1
+            line = log_buffer[line_start:line_end]
+
+            if line.strip():
+                yield _loads(line)
+
+            line_end = line_start
+
+
+# log path → {username: number of that user's sessions already in the log}
+_saved_session_counts: dict[Path, dict[str, int]] = {}
+
+# Set while _write_data runs. A Ctrl+C (or SIGTERM/SIGHUP) that arrives meanwhile
+# is held back in _deferred_interrupt and handled once the write has finished, so appended
+# sessions are always counted in _saved_session_counts before anything else runs.
+_writing = False
+_deferred_interrupt: tuple[int, FrameType | None] | None = None
+
+
+def _write_data(data_dictionary: dict, log_file_path: Path) -> None:
+
+    """
+    Write the project data to disk right away.
+
+    Sessions are stored in an append-only JSON Lines log (one session per line),
+    so only sessions that are not in the log yet get written.
+    The project name and each user's active session go into a small meta file,
+    stored as a plain {username: active_session} mapping,
+    which is rewritten every time.
     Creates the folder if it does not already exist.
+    A Ctrl+C (or SIGTERM/SIGHUP) during the write is handled only after the write is complete.
     """
-    
+
+    global _writing, _deferred_interrupt
+
+    _writing = True
+    try:
+        _append_new_sessions(data_dictionary, log_file_path)
+        _write_meta_file(data_dictionary, log_file_path)
+    finally:
+        _writing = False
+
+        if _deferred_interrupt is not None:
+            signal_number, frame = _deferred_interrupt
+            _deferred_interrupt = None
+            _flush_on_signal(signal_number, frame)
+
+
+def _append_new_sessions(data_dictionary: dict, log_file_path: Path) -> None:
+
+    """
+    Append every session that is not in the log yet, then record them as saved.
+    """
+
     # Make sure the directory exists
-    log_file_path.parent.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(log_file_path.parent)
+
+    saved_counts = _saved_session_counts.setdefault(log_file_path, {})
+
+    new_lines = []
+
+    for username, user_data in data_dictionary.get("users", {}).items():
+        first_unsaved = saved_counts.get(username, 0)
+
+        # Only encode the sessions added since the last save or load
+        for start, end, duration_seconds in zip(
+            user_data["starts"][first_unsaved:],
+            user_data["ends"][first_unsaved:],
+            user_data["durations_s"][first_unsaved:],
+        ):
+            new_lines.append(_dumps_line({
+                "user": username,
+                "start": start,
+                "end": end,
+                "dur_s": duration_seconds,
+            }))
+
+    # Append the new sessions to the end of the log in one write
+    if new_lines:
+        new_bytes = b"".join(new_lines)
+        file_descriptor = _open_cached(log_file_path)
+        _repair_log_tail(file_descriptor)
+        _write_all(file_descriptor, new_bytes)
+
+    for username, user_data in data_dictionary.get("users", {}).items():
+        saved_counts[username] = len(user_data["durations_s"])
+
+
+def _write_meta_file(data_dictionary: dict, log_file_path: Path) -> None:
+
+    """
+    Rewrite the meta file with the project name and each user's active session.
+    """
+
+    meta_data = {
+        "project": data_dictionary.get("project"),
+        "users": {
+            username: user_data.get("active_session")
+            for username, user_data in data_dictionary.get("users", {}).items()
+        },
+    }
+
+    meta_bytes = _dumps(meta_data)
+
+    # Rewrite the (small) meta file in one write, atomically
+    _replace_file(get_meta_file(log_file_path), meta_bytes)
+
 
-    # Open file for writing and save JSON inside it
-    with log_file_path.open("w", encoding="utf-8") as output_file:
-        json.dump(data_dictionary, output_file, indent=2)
+# Saves that have not been written to disk yet: log path → latest project data
+_pending: dict[Path, dict] = {}
+_dirty: set[Path] = set()
+_saves_since_flush = 0
+_last_flush_time = time.monotonic()
+_flushing = False
+
+
+def save_data(data_dictionary: dict, log_file_path: Path) -> None:
+
+    """
+    Save the project data.
+
+    Saves are batched: the data is kept in memory and written to disk once
+    SAVE_BATCH_SIZE saves have piled up or SAVE_BATCH_SECONDS have passed.
+    Anything still pending is written by flush_all(), which also runs
+    automatically at exit, on Ctrl+C, and when the process is told to stop
+    (SIGTERM, or SIGHUP when the terminal window is closed).
+    """
+
+    global _saves_since_flush
+
+    _pending[log_file_path] = data_dictionary
+    _dirty.add(log_file_path)
+    _saves_since_flush += 1
+
+    maybe_flush()
+
+
+def maybe_flush() -> None:
+
+    """
+    Write every pending save to disk if the batch is full or old enough.
+    """
+
+    batch_is_full = _saves_since_flush >= SAVE_BATCH_SIZE
+    batch_is_old = time.monotonic() - _last_flush_time >= SAVE_BATCH_SECONDS
+
+    if _dirty and (batch_is_full or batch_is_old):
+        flush_all()
+
+
+def flush_data(log_file_path: Path) -> None:
+
+    """
+    Write the pending save for one log file to disk, if there is one.
+    """
+
+    if log_file_path in _dirty:
+        _write_data(_pending[log_file_path], log_file_path)
+        _dirty.discard(log_file_path)
+        del _pending[log_file_path]
+
+
+def flush_all() -> None:
+
+    """
+    Write every pending save to disk.
+    """
+
+    global _saves_since_flush, _last_flush_time, _flushing
+
+    if _flushing:
+        return
+
+    _flushing = True
+    try:
+        for log_file_path in list(_dirty):
+            flush_data(log_file_path)
+    finally:
+        _flushing = False
+
+    _saves_since_flush = 0
+    _last_flush_time = time.monotonic()
+
+
+# atexit runs handlers last-registered-first, so pending saves are written
+# before _flush_fd_cache closes the files
+atexit.register(flush_all)
+
+
+# Signals that should not lose pending saves (SIGHUP does not exist on Windows)
+_FLUSH_SIGNALS = [
+    getattr(signal, signal_name)
+    for signal_name in ("SIGINT", "SIGTERM", "SIGHUP")
+    if hasattr(signal, signal_name)
+]
+
+# signal number → the handler that was installed before ours
+_previous_signal_handlers = {
+    signal_number: signal.getsignal(signal_number) for signal_number in _FLUSH_SIGNALS
+}
+
+
+def _flush_on_signal(signal_number: int, frame: FrameType | None) -> None:
+
+    """
+    Ctrl+C / SIGTERM / SIGHUP handler: write pending saves, then behave like
+    the previous handler. With the default handler, Ctrl+C still raises
+    KeyboardInterrupt and the other signals exit with status 128 + signal number.
+    If a write is already in progress, _write_data calls this again once it is done.
+    """
+
+    global _deferred_interrupt
+
+    if _writing:
+        _deferred_interrupt = (signal_number, frame)
+        return
+
+    flush_all()
+
+    previous_handler = _previous_signal_handlers[signal_number]
+
+    if callable(previous_handler):
+        previous_handler(signal_number, frame)
+    elif previous_handler == signal.SIG_IGN:
+        pass
+    elif signal_number == signal.SIGINT:
+        raise KeyboardInterrupt
+    else:
+        raise SystemExit(128 + signal_number)
+
+
+# Signal handlers can only be installed from the main thread
+try:
+    for signal_number in _FLUSH_SIGNALS:
+        signal.signal(signal_number, _flush_on_signal)
+except ValueError:
+    pass
+
+
+def to_epoch(timestamp: int | str | None) -> int:
+
+    """
+    Return a timestamp as whole epoch seconds.
+    The legacy .json file stores ISO strings, which are converted (0 if unreadable).
+    """
+
+    if isinstance(timestamp, int):
+        return timestamp
+
+    try:
+        return int(datetime.fromisoformat(timestamp).timestamp())
+    except Exception:
+        return 0
+
+
+def minutes_to_seconds(duration_minutes: float) -> int:
+
+    """
+    Convert a duration in minutes (how the legacy .json file stored it) into whole seconds.
+    """
+
+    return int(round(duration_minutes * 60))
+
+
+def format_duration(duration_seconds: int) -> str:
+
+    """
+    Format a duration in seconds for display, e.g. 754 -> "12m34s".
+    """
+
+    return f"{duration_seconds // 60}m{duration_seconds % 60}s"
+
+
+def format_timestamp(epoch_seconds: int) -> str:
+
+    """
+    Format epoch seconds as a local ISO timestamp for display.
+    """
+
+    return datetime.fromtimestamp(epoch_seconds).isoformat(timespec="seconds")
+
+
+def _upgrade_user_entry(user_data: dict) -> None:
+
+    """
+    Bring a user entry from an older log up to the current layout:
+      - a "sessions" list of session dictionaries becomes parallel
+        "starts", "ends" and "durations_s" arrays
+      - durations in minutes become whole seconds
+      - an ISO "active_session" string becomes epoch seconds
+    Entries that are already up to date are left alone.
+    """
+
+    if user_data.get("active_session") is not None:
+        user_data["active_session"] = to_epoch(user_data["active_session"])
+
+    if "durations_s" in user_data:
+        return
+
+    sessions = user_data.pop("sessions", [])
+    user_data["starts"] = array("q", (to_epoch(s.get("start")) for s in sessions))
+    user_data["ends"] = array("q", (to_epoch(s.get("end") or s.get("start")) for s in sessions))
+    user_data["durations_s"] = array("q", (minutes_to_seconds(s["duration_minutes"]) for s in sessions))
+
+
+def _meta_to_project_data(meta_data: dict) -> dict:
+
+    """
+    Turn a loaded meta file into a project data dictionary with one empty entry
+    per user, ready for the session log to be replayed into.
+    """
+
+    project_data = new_project_data(meta_data.get("project"))
+
+    for username, active_session in meta_data.get("users", {}).items():
+        # Names are interned since they become long-lived keys
+        username = sys.intern(username)
+        ensure_user(project_data, username)
+        project_data["users"][username]["active_session"] = active_session
+
+    return project_data
+
+
+def new_project_data(project_name: str) -> dict:
+
+    """
+    Return a brand new, empty data structure for a project.
+    """
+
+    return {
+        "project": project_name,
+        "users": {}   # username → {starts: [...], ends: [...], durations_s: [...], active_session: ...}
+                      # (times are epoch seconds, durations are whole seconds)
+    }
 
 
 def load_data(log_file_path: Path, project_name: str) -> dict:
     
     """
-    Load the project's JSON log data from disk.
+    Load the project's log data from disk.
 
-    If the file exists:
-      - Load and return the stored JSON data.
+    If the session log or meta file exists:
+      - Load the meta file and replay every session from the log.
       - Make sure a project name is included.
 
-    If the file does not exist:
+    If only an old single-file JSON log exists (myproject_time_log.json):
+      - Load it and convert each user's sessions into parallel arrays.
+      - The next save moves all of its sessions into the new log.
+
+    If nothing exists yet:
       - Create and return a new empty data structure for this project.
     """
 
+    # Make sure a batched save for this log is on disk before reading it
+    flush_data(log_file_path)
+
+    meta_file_path = get_meta_file(log_file_path)
+    legacy_file_path = log_file_path.with_suffix(".json")
+
     #~*~*~*~*~*~*~*~*~*~*~*~*~*~*~*~*~*
     # Log file already exists on disk
     #~*~*~*~*~*~*~*~*~*~*~*~*~*~*~*~*~*
     
-    if log_file_path.exists():
-        with log_file_path.open("r", encoding="utf-8") as input_file:
-            loaded_data = json.load(input_file)
+    if meta_file_path.exists() or log_file_path.exists():
+        meta_data = _read_json_file(meta_file_path) if meta_file_path.exists() else {}
+        loaded_data = _meta_to_project_data(meta_data)
+
+        # username → that user's (starts, ends, durations_s) arrays, so each
+        # replayed row costs one dict lookup instead of a chain of them
+        session_columns = {
+            username: (user_data["starts"], user_data["ends"], user_data["durations_s"])
+            for username, user_data in loaded_data["users"].items()
+        }
 
-        # Make sure "project" exists in the data
-        if "project" not in loaded_data:
-            loaded_data["project"] = project_name
+        # Replay the session log into each user's session arrays
+        for row in iter_sessions(log_file_path):
+            columns = session_columns.get(row["user"])
+            if columns is None:
+                # First row for a user missing from the meta file. The name is
+                # interned since it becomes a long-lived key.
+                username = sys.intern(row["user"])
+                ensure_user(loaded_data, username)
+                user_data = loaded_data["users"][username]
+                columns = (user_data["starts"], user_data["ends"], user_data["durations_s"])
+                session_columns[username] = columns
+
+            starts, ends, durations_s = columns
+            starts.append(row["start"])
+            ends.append(row["end"])
+            durations_s.append(row["dur_s"])
+
+        # One C-level sum per user instead of a running total per row
+        for user_data in loaded_data["users"].values():
+            user_data["total_seconds"] = sum(user_data["durations_s"])
+
+        _saved_session_counts[log_file_path] = {
+            username: len(user_data["durations_s"])
+            for username, user_data in loaded_data["users"].items()
+        }
+
+    #~*~*~*~*~*~*~*~*~*~*~*~*~*~*~*~*~*
+    # Old single-file JSON log
+    #~*~*~*~*~*~*~*~*~*~*~*~*~*~*~*~*~*
+
+    elif legacy_file_path.exists():
+        loaded_data = _read_json_file(legacy_file_path)
 
-        # Make sure "users" exists in the data
-        if "users" not in loaded_data:
-            loaded_data["users"] = {}
+        for user_data in loaded_data.get("users", {}).values():
+            _upgrade_user_entry(user_data)
 
-        return loaded_data
+        # Nothing is in the new log yet, so the next save writes every session
+        _saved_session_counts[log_file_path] = {}
 
     #~*~*~*~*~*~*~*~*~*~*~*~*~*~*~*~*~*
     # Log file does NOT exist yet
     # Return a brand new structure
     #~*~*~*~*~*~*~*~*~*~*~*~*~*~*~*~*~*
-    
-    return {
-        "project": project_name,
-        "users": {}   # username → {sessions: [...], active_session: ...}
-    }
+
+    else:
+        _saved_session_counts[log_file_path] = {}
+        return new_project_data(project_name)
+
+    # Make sure "project" exists in the data
+    if not loaded_data.get("project"):
+        loaded_data["project"] = project_name
+
+    # Make sure "users" exists in the data
+    if "users" not in loaded_data:
+        loaded_data["users"] = {}
+
+    return loaded_data
 
 
 def ensure_user(project_data: dict, username: str) -> dict:
@@ -178,8 +861,11 @@ def ensure_user(project_data: dict, username: str) -> dict:
 
     if username not in project_data["users"]:
         project_data["users"][username] = {
-            "sessions": [],
+            "starts": array("q"),       # epoch seconds
+            "ends": array("q"),         # epoch seconds
+            "durations_s": array("q"),  # whole seconds
             "active_session": None,
+            "total_seconds": 0,
         }
 
     return project_data
@@ -201,8 +887,8 @@ def clock_in(user_data: dict) -> dict:
 
     Parameters:
       user_data (dict): The dictionary for this specific user containing:
-                        - "active_session": ISO string or None
-                        - "sessions": list of past session dictionaries
+                        - "active_session": start time in epoch seconds, or None
+                        - "starts" / "ends" / "durations_s": past sessions
 
     Returns:
       dict: The updated user_data dictionary with:
@@ -212,16 +898,16 @@ def clock_in(user_data: dict) -> dict:
 
     if user_data.get("active_session") is not None:
         print("\nAlready clocked in.")
-        print(f"Started at: {user_data['active_session']}\n")
+        print(f"Started at: {format_timestamp(user_data['active_session'])}\n")
         return user_data
 
-    # Create new ISO timestamp for session start
-    now = datetime.now().isoformat(timespec="seconds")
+    # Session start as whole epoch seconds
+    now = int(time.time())
 
     # Set as current active session
     user_data["active_session"] = now
 
-    print(f"\nClocked in at {now}\n")
+    print(f"\nClocked in at {format_timestamp(now)}\n")
 
     return user_data
 
@@ -234,7 +920,7 @@ def clock_out(user_data: dict) -> dict:
     Returns:
       dict: The updated user_data dictionary with:
             - active_session set to None -> clocked out
-            - new session appended to sessions list
+            - new session appended to the starts / ends / durations_s arrays
     """
 
     start = user_data.get("active_session")
@@ -242,25 +928,23 @@ def clock_out(user_data: dict) -> dict:
         print("\nYou are not currently clocked in.\n")
         return user_data
 
-    end = datetime.now().isoformat(timespec="seconds")
+    end = int(time.time())
 
-    # Convert stored ISO strings into datetime objects
-    start_dt = datetime.fromisoformat(start)
-    end_dt = datetime.fromisoformat(end)
+    # Both times are epoch seconds, so the length is a plain subtraction
+    duration_seconds = end - start
 
-    duration_minutes = round((end_dt - start_dt).total_seconds() / 60, 2)
+    # Keep the running total up to date so summaries never re-add every session
+    user_data["total_seconds"] = get_total_seconds(user_data) + duration_seconds
 
-    user_data["sessions"].append({
-        "start": start,
-        "end": end,
-        "duration_minutes": duration_minutes,
-    })
+    user_data["starts"].append(start)
+    user_data["ends"].append(end)
+    user_data["durations_s"].append(duration_seconds)
 
     # Clear the active session
     user_data["active_session"] = None
 
-    print(f"\nClocked out at {end}")
-    print(f"Session length: {duration_minutes} minutes\n")
+    print(f"\nClocked out at {format_timestamp(end)}")
+    print(f"Session length: {format_duration(duration_seconds)}\n")
 
     return user_data
 
@@ -272,7 +956,7 @@ def show_status(user_data: dict, username: str) -> None:
 
     Parameters:
       user_data (dict): The dictionary for this user containing:
-                        - "sessions": list of session records
+                        - "starts" / "ends" / "durations_s": session records
                         - "active_session": current start time or None
       username (str):   The user whose summary is being displayed.
 
@@ -282,36 +966,52 @@ def show_status(user_data: dict, username: str) -> None:
 
     start = user_data.get("active_session")
 
-    if start:
+    if start is not None:
         print(f"\nStatus for {username}: Clocked in")
-        print(f"Started at: {start}\n")
+        print(f"Started at: {format_timestamp(start)}\n")
         return
 
     print(f"\nStatus for {username}: Not clocked in\n")
 
 
+def get_total_seconds(user_data: dict) -> int:
+
+    """
+    Return the user's total logged seconds from the running "total_seconds" counter.
+    If the counter is missing, it is worked out once from the durations
+    and stored on user_data for next time.
+    """
+
+    if "total_seconds" not in user_data:
+        user_data["total_seconds"] = sum(user_data["durations_s"])
+
+    return user_data["total_seconds"]
+
+
 def show_summary(user_data: dict, username: str) -> None:
     
     """
     Display total time and recent sessions for the specified user.
     """
 
-    sessions = user_data.get("sessions", [])
-    if not sessions:
+    durations = user_data["durations_s"]
+    if not durations:
         print(f"\nNo sessions logged yet for {username}.\n")
         return
 
-    total_minutes = sum(s["duration_minutes"] for s in sessions)
+    total_minutes = round(get_total_seconds(user_data) / 60, 2)
     total_hours = round(total_minutes / 60, 2)
 
     print(f"\n=== Dev Time Summary for {username} ===")
-    print(f"Total sessions: {len(sessions)}")
+    print(f"Total sessions: {len(durations)}")
     print(f"Total minutes:  {total_minutes}")
     print(f"Total hours:    {total_hours}")
 
     print("\nLast 5 sessions:")
-    for s in sessions[-5:]:
-        print(f"  {s['start']} -> {s['end']}  ({s['duration_minutes']} min)")
+    for start, end, duration_seconds in zip(
+        user_data["starts"][-5:], user_data["ends"][-5:], durations[-5:]
+    ):
+        print(f"  {format_timestamp(start)} -> {format_timestamp(end)}  ({format_duration(duration_seconds)})")
     print()
 
 
@@ -335,13 +1035,12 @@ def list_all_users_summary(data: dict) -> None:
     print("\n=== All Users Summary (this project) ===")
 
     for username, user_data in users.items():
-        sessions = user_data.get("sessions", [])
-        total_minutes = sum(s["duration_minutes"] for s in sessions)
+        total_minutes = round(get_total_seconds(user_data) / 60, 2)
         total_hours = round(total_minutes / 60, 2)
 
         print(
             f"- {username}: {total_minutes} minutes "
-            f"({total_hours} hours, {len(sessions)} sessions)"
+            f"({total_hours} hours, {len(user_data['durations_s'])} sessions)"
         )
 
     print()
@@ -356,6 +1055,55 @@ def list_all_users_summary(data: dict) -> None:
 
 
 
+def load_recent_sessions(log_file_path: Path, username: str, days: int) -> dict:
+
+    """
+    Read only the specified user's sessions from the last N days, straight
+    from the end of the session log, without loading the whole project.
+
+    Each user's sessions are appended in order, so reading stops at the
+    user's first session that ended before the cutoff. That session is kept
+    too, so time_report can still tell "nothing in the last N days" apart
+    from "nothing logged at all"; its own cutoff leaves it out of the report.
+
+    Parameters:
+      log_file_path (Path): The project's session log file.
+      username (str):       The user whose sessions are wanted.
+      days (int):           How many days of history to include.
+
+    Returns:
+      dict: A user_data-style dictionary holding just those sessions
+            ("starts" / "ends" / "durations_s"), ready to pass to time_report.
+    """
+
+    # Make sure a batched save for this log is on disk before reading it
+    flush_data(log_file_path)
+
+    cutoff_epoch = (datetime.now() - timedelta(days=days)).timestamp()
+
+    starts = []
+    ends = []
+    durations = []
+
+    for row in iter_sessions_reversed(log_file_path):
+        if row["user"] != username:
+            continue
+
+        starts.append(row["start"])
+        ends.append(row["end"])
+        durations.append(row["dur_s"])
+
+        if row["end"] < cutoff_epoch:
+            break
+
+    # Rows were read newest first, put them back in chronological order
+    return {
+        "starts": array("q", reversed(starts)),
+        "ends": array("q", reversed(ends)),
+        "durations_s": array("q", reversed(durations)),
+    }
+
+
 def time_report(user_data: dict, username: str, days: int) -> None:
 
     """
@@ -363,7 +1111,9 @@ def time_report(user_data: dict, username: str, days: int) -> None:
 
     Parameters:
       user_data (dict): The dictionary for this user containing:
-                        - "sessions": list of session records
+                        - "starts" / "ends" / "durations_s": session records
+                        (either the loaded user entry, or the result of
+                        load_recent_sessions for the same number of days)
       username (str):   The user whose report is being displayed.
       days (int):       How many days of history to include.
 
@@ -371,31 +1121,23 @@ def time_report(user_data: dict, username: str, days: int) -> None:
       None: This function prints a formatted report.
     """
 
-    sessions = user_data.get("sessions", [])
-    if not sessions:
+    if not user_data["durations_s"]:
         print(f"\nNo sessions logged yet for {username}.\n")
         return
 
     now = datetime.now()
     cutoff = now - timedelta(days=days)
 
-    # Gather only sessions whose end timestamp is within the cutoff window
-    filtered = []
-    for session in sessions:
-        end_str = session.get("end") or session.get("start")
-        try:
-            end_dt = datetime.fromisoformat(end_str)
-        except Exception:
-            continue
+    # Sessions are stored oldest first, so binary search the end times for the
+    # first one inside the cutoff window and take everything after it
+    first_index = bisect.bisect_left(user_data["ends"], cutoff.timestamp())
+    filtered_durations = user_data["durations_s"][first_index:]
 
-        if end_dt >= cutoff:
-            filtered.append(session)
-
-    if not filtered:
+    if not filtered_durations:
         print(f"\nNo sessions for {username} in the last {days} days.\n")
         return
 
-    total_minutes = sum(s["duration_minutes"] for s in filtered)
+    total_minutes = round(sum(filtered_durations) / 60, 2)
     total_hours = round(total_minutes / 60, 2)
 
     label = {
@@ -405,25 +1147,37 @@ def time_report(user_data: dict, username: str, days: int) -> None:
     }.get(days, f"Last {days} days")
 
     print(f"\n=== {label} Report for {username} ===")
-    print(f"Sessions:      {len(filtered)}")
+    print(f"Sessions:      {len(filtered_durations)}")
     print(f"Total minutes: {total_minutes}")
     print(f"Total hours:   {total_hours}")
 
     print("\nSessions:")
-    for s in filtered:
-        print(f"  {s['start']} -> {s['end']}  ({s['duration_minutes']} min)")
+    for start, end, duration_seconds in zip(
+        user_data["starts"][first_index:], user_data["ends"][first_index:], filtered_durations
+    ):
+        print(f"  {format_timestamp(start)} -> {format_timestamp(end)}  ({format_duration(duration_seconds)})")
     print()
 
 
-def report_menu(user_data: dict, username: str) -> None:
+# Report menu choice → how many days the report covers
+_REPORT_DISPATCH = {
+    "1": 1,
+    "2": 7,
+    "3": 30,
+}
+
+
+def report_menu(log_file_path: Path, username: str) -> None:
 
     """
     Display a sub-menu of time reports (daily, weekly, monthly)
     and allow the user to choose which report to view.
+    Each report reads only its own days from the end of the session log, so it
+    covers every session passed to save_data (pending saves are flushed first).
 
     Parameters:
-      user_data (dict): The dictionary for this user containing session records.
-      username (str):   The user requesting the reports.
+      log_file_path (Path): The project's session log file.
+      username (str):       The user requesting the reports.
 
     Returns:
       None: This function prints menu options and calls report functions.
@@ -438,14 +1192,13 @@ def report_menu(user_data: dict, username: str) -> None:
 
         choice = input("Enter choice: ").strip()
 
-        if choice == "1":
-            time_report(user_data, username, days=1)
-        elif choice == "2":
-            time_report(user_data, username, days=7)
-        elif choice == "3":
-            time_report(user_data, username, days=30)
-        elif choice == "4":
+        if choice == "4":
             break
-        else:
+
+        days = _REPORT_DISPATCH.get(choice)
+        if days is None:
             print("\nInvalid choice.\n")
+            continue
+
+        time_report(load_recent_sessions(log_file_path, username, days), username, days=days)
 